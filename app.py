@@ -1,12 +1,31 @@
 import os
 import re
 import sys
-import pdfplumber
-import spacy
-from docx2txt import process
 
 print("Resume Parser Initialized")
 
+_NOT_NAME_RE = re.compile(r'[@\d]')
+# The local part only starts where the previous character can't belong to it,
+# so a failed match isn't retried from every word boundary inside a long
+# dotted run; domain labels cannot contain or end with '.'
+_EMAIL_RE = re.compile(
+    r'(?<![A-Za-z0-9._%+-])[A-Za-z0-9._%+-]+@'
+    r'[A-Za-z0-9](?:[A-Za-z0-9-]*[A-Za-z0-9])?'
+    r'(?:\.[A-Za-z0-9](?:[A-Za-z0-9-]*[A-Za-z0-9])?)*'
+    r'\.[A-Za-z]{2,24}\b')
+_PHONE_RE = re.compile(r'\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}')
+
+# Section name -> (header keyword search, prefixes that end the section, max lines kept)
+# Headers match anywhere in the line; end markers only at its start (re.match)
+_SECTION_RULES = {
+    'skills': (re.compile(r'skills|technical skills|technologies|programming languages', re.I),
+               re.compile(r'experience|education|projects|work history', re.I), 5),
+    'education': (re.compile(r'education|academic|university|college|degree', re.I),
+                  re.compile(r'experience|skills|projects|work history', re.I), 3),
+    'experience': (re.compile(r'experience|work history|employment|professional experience', re.I),
+                   re.compile(r'education|skills|projects', re.I), 5),
+}
+
 def extract_text_from_file(file_path):
     """Extract text from PDF or DOCX file"""
     file_extension = os.path.splitext(file_path)[1].lower()
@@ -19,12 +38,11 @@ def extract_text_from_file(file_path):
         raise ValueError(f"Unsupported file format: {file_extension}. Only PDF and DOCX are supported.")
 
 def extract_text_from_pdf(pdf_path):
-    """Extract text from PDF using pdfplumber"""
+    """Extract text from PDF using pdfminer"""
+    from pdf_text import extract_pdf_text
+    
     try:
-        with pdfplumber.open(pdf_path) as pdf:
-            text = ""
-            for page in pdf.pages:
-                text += page.extract_text() or ""
+        text = extract_pdf_text(pdf_path)
         print("PDF content extracted successfully")
         return text
     except Exception as e:
@@ -32,6 +50,8 @@ def extract_text_from_pdf(pdf_path):
 
 def extract_text_from_docx(docx_path):
     """Extract text from DOCX using docx2txt"""
+    from docx2txt import process
+    
     try:
         text = process(docx_path)
         print("DOCX content extracted successfully")
@@ -49,13 +69,14 @@ def extract_resume_data(resume_path):
             raise Exception("No text content found in the file")
         
         # Parse the extracted text
+        sections = _extract_sections(text)
         data = {
             'name': extract_name(text),
             'email': extract_email(text), 
             'mobile_number': extract_phone(text),
-            'skills': extract_skills(text),
-            'education': extract_education(text),
-            'experience': extract_experience(text)
+            'skills': sections['skills'],
+            'education': sections['education'],
+            'experience': sections['experience']
         }
         
         return data
@@ -70,78 +91,54 @@ def extract_name(text):
     # Usually name is in the first few lines
     for line in lines[:5]:
         line = line.strip()
-        if line and len(line.split()) <= 4 and not '@' in line and not any(char.isdigit() for char in line):
+        if line and len(line.split()) <= 4 and not _NOT_NAME_RE.search(line):
             return line
     return "Not found"
 
 def extract_email(text):
     """Extract email using regex"""
-    email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-    emails = re.findall(email_pattern, text)
-    return emails[0] if emails else "Not found"
+    match = _EMAIL_RE.search(text)
+    return match.group(0) if match else "Not found"
 
 def extract_phone(text):
     """Extract phone number using regex"""
-    phone_pattern = r'(\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4})'
-    phones = re.findall(phone_pattern, text)
-    return phones[0] if phones else "Not found"
-
-def extract_skills(text):
-    """Extract skills section"""
-    skills_keywords = ['skills', 'technical skills', 'technologies', 'programming languages']
-    lines = text.split('\n')
-    skills_section = []
-    capture = False
+    match = _PHONE_RE.search(text)
+    return match.group(0) if match else "Not found"
+
+def _extract_sections(text):
+    """Collect the skills, education and experience sections in one pass over the lines"""
+    sections = {name: [] for name in _SECTION_RULES}
+    capturing = dict.fromkeys(_SECTION_RULES, False)
+    pending = set(_SECTION_RULES)
     
-    for line in lines:
-        line_lower = line.lower().strip()
-        if any(keyword in line_lower for keyword in skills_keywords):
-            capture = True
-            continue
-        elif capture and (line_lower.startswith(('experience', 'education', 'projects', 'work history'))):
+    for line in text.split('\n'):
+        if not pending:
             break
-        elif capture and line.strip():
-            skills_section.append(line.strip())
+        line_stripped = line.strip()
+        for name in tuple(pending):
+            header_re, end_re, limit = _SECTION_RULES[name]
+            if header_re.search(line_stripped):
+                capturing[name] = True
+            elif capturing[name] and end_re.match(line_stripped):
+                pending.discard(name)
+            elif capturing[name] and line_stripped:
+                sections[name].append(line_stripped)
+                if len(sections[name]) == limit:
+                    pending.discard(name)
     
-    return skills_section[:5] if skills_section else ["Not found"]
+    return {name: lines or ["Not found"] for name, lines in sections.items()}
+
+def extract_skills(text):
+    """Extract skills section"""
+    return _extract_sections(text)['skills']
 
 def extract_education(text):
     """Extract education information"""
-    education_keywords = ['education', 'academic', 'university', 'college', 'degree']
-    lines = text.split('\n')
-    education_section = []
-    capture = False
-    
-    for line in lines:
-        line_lower = line.lower().strip()
-        if any(keyword in line_lower for keyword in education_keywords):
-            capture = True
-            continue
-        elif capture and (line_lower.startswith(('experience', 'skills', 'projects', 'work history'))):
-            break
-        elif capture and line.strip():
-            education_section.append(line.strip())
-    
-    return education_section[:3] if education_section else ["Not found"]
+    return _extract_sections(text)['education']
 
 def extract_experience(text):
     """Extract work experience"""
-    experience_keywords = ['experience', 'work history', 'employment', 'professional experience']
-    lines = text.split('\n')
-    experience_section = []
-    capture = False
-    
-    for line in lines:
-        line_lower = line.lower().strip()
-        if any(keyword in line_lower for keyword in experience_keywords):
-            capture = True
-            continue
-        elif capture and (line_lower.startswith(('education', 'skills', 'projects'))):
-            break
-        elif capture and line.strip():
-            experience_section.append(line.strip())
-    
-    return experience_section[:5] if experience_section else ["Not found"]
+    return _extract_sections(text)['experience']
 
 # Find resume file - try multiple formats
 def find_resume_file():
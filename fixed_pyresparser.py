@@ -1,83 +1,147 @@
 import os
 import sys
-import spacy
-from spacy.matcher import Matcher
+import csv
+import functools
+from concurrent.futures import ProcessPoolExecutor
 import re
-import pdfplumber
-from docx2txt import process
-import pandas as pd
+from collections import defaultdict
+
+from regex_parser import EMAIL_RE
 
 print("Fixed PyResParser with spaCy and NLTK")
 
+# The small pipeline ships without a static word-vector table. Nothing here
+# reads token.vector or calls similarity(), so md/lg would only add hundreds
+# of MB per worker and a slower load for the same NER output
+SPACY_MODEL = 'en_core_web_sm'
+
+# Pipeline components we never read from; NER and the Matcher are all we need.
+# In the en_core_web_* pipelines NER embeds tokens with its own internal layer,
+# so the shared tok2vec only feeds the tagger/parser and can go as well.
+# Excluded components are never loaded, unlike disabled ones.
+EXCLUDED_COMPONENTS = ('tok2vec', 'tagger', 'parser', 'attribute_ruler', 'lemmatizer', 'senter')
+
+# Regexes used on every parse, compiled once at import
+# Local and international numbers in one pattern (optional +country code prefix)
+_PHONE_RE = re.compile(r'(?:\+\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}')
+_EXP_YEARS_RE = re.compile(r'(\d+)[\s+]*(?:years?|experience)', re.I)
+# Digits, '@' or an address word rule a line out as a name
+_NOT_NAME_RE = re.compile(
+    r'[@\d]|\b(?:street|road|avenue|drive|lane|heritage|apartment|building)\b', re.I)
+# Keyword lists for entity/sentence filters, matched as plain substrings
+_EDU_ORG_RE = re.compile(r'university|college|institute|school', re.I)
+_TECH_ENT_RE = re.compile(r'js|sql|api|framework|library', re.I)
+_JOB_TITLE_RE = re.compile(
+    r'engineer|developer|manager|analyst|consultant|specialist|coordinator|director'
+    r'|lead|senior|junior|intern|associate|architect|designer', re.I)
+_LINKEDIN_RE = re.compile(r'https?://(?:www\.)?(?:in\.)?linkedin\.com/in/([a-zA-Z0-9-]+)')
+
+# Names sit in the first HEADER_CHARS characters; the rest of the NER
+# input is limited to the sections whose entities we actually read
+HEADER_CHARS = 2000
+_SECTION_HEADER_RE = re.compile(
+    r'^[^\S\n]*(?:'
+    r'(?P<education>education|academic)'
+    r'|(?P<experience>(?:work |professional )?experience|work history|employment)'
+    r'|(?P<skills>(?:technical )?skills|technologies)'
+    r'|projects|certifications?|achievements|awards|publications|interests|hobbies'
+    r'|languages|references|personal|declaration'
+    r')\b',
+    re.I | re.M)
+
+@functools.lru_cache(maxsize=4)
+def _get_nlp(model=SPACY_MODEL, exclude=EXCLUDED_COMPONENTS):
+    """Load a spaCy pipeline once per process and reuse it for every parser"""
+    # Imported here so importing this module stays cheap until a parser is built
+    import spacy
+    
+    # Load spaCy model with fallback
+    # Only NER is used, so skip the tagger/parser/lemmatizer; sentences come
+    # from the rule-based sentencizer below instead of the dependency parser
+    try:
+        nlp = spacy.load(model, exclude=list(exclude))
+    except OSError:
+        # Fallback: try to download and load
+        try:
+            import subprocess
+            subprocess.run(["python", "-m", "spacy", "download", model], check=True)
+            nlp = spacy.load(model, exclude=list(exclude))
+        except:
+            # Final fallback: use blank model with basic components
+            print("Warning: Using basic spaCy model without pre-trained vectors")
+            nlp = spacy.blank('en')
+    return nlp
+
+@functools.lru_cache(maxsize=1)
+def _get_sentencizer():
+    """Rule-based sentence splitter, applied to tokenizer-only docs"""
+    from spacy.pipeline import Sentencizer
+    
+    return Sentencizer()
+
+# Token patterns for the shared Matcher
+_EMAIL_PATTERNS = [
+    [{"LIKE_EMAIL": True}],
+]
+_PHONE_PATTERNS = [
+    [{"SHAPE": "ddd-ddd-dddd"}],
+    [{"SHAPE": "(ddd) ddd-dddd"}],
+    [{"SHAPE": "ddd.ddd.dddd"}],
+    [{"SHAPE": "ddd ddd dddd"}]
+]
+_DEGREE_PATTERNS = [
+    [{"LOWER": {"IN": ["bachelor", "master", "phd", "doctorate", "b.s.", "m.s.", "ph.d."]}},
+     {"LOWER": "of", "OP": "?"},
+     {"LOWER": {"IN": ["science", "arts", "engineering", "technology", "business"]}}],
+    [{"LOWER": {"IN": ["bs", "ms", "phd", "ba", "ma"]}},
+     {"LOWER": "in", "OP": "?"}]
+]
+
+@functools.lru_cache(maxsize=4)
+def _get_matcher(nlp):
+    """Build the email/phone/degree Matcher once per pipeline"""
+    from spacy.matcher import Matcher
+    
+    matcher = Matcher(nlp.vocab)
+    matcher.add("EMAIL", _EMAIL_PATTERNS)
+    matcher.add("PHONE", _PHONE_PATTERNS)
+    matcher.add("DEGREE", _DEGREE_PATTERNS)
+    return matcher
+
+@functools.lru_cache(maxsize=4)
+def _get_skill_matcher(nlp, skills):
+    """Build a case-insensitive PhraseMatcher with one phrase per skill"""
+    from spacy.matcher import PhraseMatcher
+    
+    matcher = PhraseMatcher(nlp.vocab, attr='LOWER')
+    matcher.add("SKILL", list(nlp.tokenizer.pipe(skills)))
+    return matcher
+
 class FixedResumeParser:
     """Fixed version of ResumeParser using modern spaCy and NLTK"""
     
-    def __init__(self, resume_path, skills_file=None):
-        # Load spaCy model with fallback
-        try:
-            self.nlp = spacy.load('en_core_web_sm')
-        except OSError:
-            # Fallback: try to download and load
-            try:
-                import subprocess
-                subprocess.run(["python", "-m", "spacy", "download", "en_core_web_sm"], check=True)
-                self.nlp = spacy.load('en_core_web_sm')
-            except:
-                # Final fallback: use blank model with basic components
-                print("Warning: Using basic spaCy model without pre-trained vectors")
-                self.nlp = spacy.blank('en')
-                self.nlp.add_pipe('sentencizer')
-        
-        self.matcher = Matcher(self.nlp.vocab)
+    def __init__(self, resume_path=None, skills_file=None):
+        # The loaded pipeline is shared across parser instances
+        self.nlp = _get_nlp()
         self.resume_path = resume_path
         
-        # Setup entity patterns for better extraction
-        self._setup_patterns()
-        
         # Load skills database if provided
         self.skills_db = self._load_skills_database(skills_file)
-    
-    def _setup_patterns(self):
-        """Setup spaCy patterns for entity recognition"""
-        
-        # Email pattern
-        email_pattern = [{"LIKE_EMAIL": True}]
-        self.matcher.add("EMAIL", [email_pattern])
-        
-        # Phone patterns
-        phone_patterns = [
-            [{"SHAPE": "ddd-ddd-dddd"}],
-            [{"SHAPE": "(ddd) ddd-dddd"}],
-            [{"SHAPE": "ddd.ddd.dddd"}],
-            [{"SHAPE": "ddd ddd dddd"}]
-        ]
-        self.matcher.add("PHONE", phone_patterns)
-        
-        # Degree patterns
-        degree_patterns = [
-            [{"LOWER": {"IN": ["bachelor", "master", "phd", "doctorate", "b.s.", "m.s.", "ph.d."]}},
-             {"LOWER": "of", "OP": "?"},
-             {"LOWER": {"IN": ["science", "arts", "engineering", "technology", "business"]}}],
-            [{"LOWER": {"IN": ["bs", "ms", "phd", "ba", "ma"]}},
-             {"LOWER": "in", "OP": "?"}]
-        ]
-        self.matcher.add("DEGREE", degree_patterns)
-        
-        # Skills patterns - common tech skills
-        skill_patterns = [
-            [{"LOWER": {"IN": ["python", "java", "javascript", "react", "angular", "node.js", "docker", "kubernetes"]}}],
-            [{"LOWER": "machine"}, {"LOWER": "learning"}],
-            [{"LOWER": "data"}, {"LOWER": "science"}],
-            [{"LOWER": "artificial"}, {"LOWER": "intelligence"}]
-        ]
-        self.matcher.add("SKILL", skill_patterns)
+        
+        # Entity patterns for better extraction; the configured matchers are
+        # cached per pipeline (and skills list) and shared across instances
+        self.matcher = _get_matcher(self.nlp)
+        self.skill_matcher = _get_skill_matcher(self.nlp, tuple(self.skills_db))
     
     def _load_skills_database(self, skills_file):
         """Load skills database from CSV or use default"""
         if skills_file and os.path.exists(skills_file):
             try:
-                df = pd.read_csv(skills_file)
-                return df['skill'].str.lower().tolist() if 'skill' in df.columns else []
+                with open(skills_file, newline='', encoding='utf-8') as f:
+                    reader = csv.DictReader(f)
+                    if 'skill' not in (reader.fieldnames or []):
+                        return []
+                    return [row['skill'].lower() for row in reader if row['skill']]
             except:
                 pass
         
@@ -86,7 +150,7 @@ class FixedResumeParser:
             'python', 'java', 'javascript', 'react', 'angular', 'vue', 'node.js',
             'django', 'flask', 'spring', 'express', 'docker', 'kubernetes',
             'aws', 'azure', 'gcp', 'mongodb', 'postgresql', 'mysql', 'redis',
-            'machine learning', 'deep learning', 'data science', 'ai', 'ml',
+            'machine learning', 'deep learning', 'data science', 'artificial intelligence', 'ai', 'ml',
             'tensorflow', 'pytorch', 'scikit-learn', 'pandas', 'numpy',
             'git', 'jenkins', 'ci/cd', 'agile', 'scrum', 'rest api', 'graphql'
         ]
@@ -96,17 +160,15 @@ class FixedResumeParser:
         file_ext = os.path.splitext(file_path)[1].lower()
         
         if file_ext == '.pdf':
-            with pdfplumber.open(file_path) as pdf:
-                text = ""
-                for page in pdf.pages:
-                    text += page.extract_text() or ""
-                return text
+            from pdf_text import extract_pdf_text
+            return extract_pdf_text(file_path)
         elif file_ext in ['.docx', '.doc']:
+            from docx2txt import process
             return process(file_path)
         else:
             raise ValueError(f"Unsupported file format: {file_ext}")
     
-    def _extract_name_with_spacy(self, text):
+    def _extract_name_with_spacy(self, text, doc, matches):
         """Extract name using spaCy NER with improved logic"""
         lines = text.split('\n')
         potential_names = []
@@ -120,17 +182,18 @@ class FixedResumeParser:
         # Strategy 1: Look for name patterns in first few lines
         for line in lines[:8]:  # Check first 8 lines
             line = line.strip()
+            line_lower = line.lower()
             # Skip empty lines and obvious non-names
-            if not line or '@' in line or 'phone' in line.lower() or 'email' in line.lower():
+            if not line or '@' in line or 'phone' in line_lower or 'email' in line_lower:
                 continue
             
             # Check for lines with mixed content (name + keywords)
-            if any(keyword in line.lower() for keyword in ['objective', 'career', 'summary', 'profile']):
+            if any(keyword in line_lower for keyword in ['objective', 'career', 'summary', 'profile']):
                 mixed_content_lines.append(line)
                 continue
                 
             # Skip other common resume section headers
-            if any(header in line.lower() for header in [
+            if any(header in line_lower for header in [
                 'experience', 'education', 'skills', 'project management', 
                 'contact', 'about', 'summary'
             ]):
@@ -138,15 +201,13 @@ class FixedResumeParser:
                 
             # Check if line looks like a name (all caps, title case, or proper formatting)
             words = line.split()
-            if (1 <= len(words) <= 4 and 
-                not any(char.isdigit() for char in line) and
-                not any(word.lower() in ['street', 'road', 'avenue', 'drive', 'lane', 'heritage', 'apartment', 'building'] for word in words)):
+            if 1 <= len(words) <= 4 and not _NOT_NAME_RE.search(line):
                 
                 # Additional checks to filter out obviously bad lines
                 max_word_length = max(len(word.rstrip('.,;:!?')) for word in words)
                 has_company_punctuation = any(char in line for char in '()[]{}/')
                 tech_company_terms = ['datacom', 'edtech', 'gaming', 'networking', 'startups', 'systems', 'cratos']
-                has_tech_terms = any(term in line.lower() for term in tech_company_terms)
+                has_tech_terms = any(term in line_lower for term in tech_company_terms)
                 
                 # Prefer lines that are all caps or title case (typical resume formatting)
                 if (line.isupper() or line.istitle() or 
@@ -219,12 +280,14 @@ class FixedResumeParser:
         
         # Strategy 2: Use spaCy NER but with better filtering (if available)
         try:
-            doc = self.nlp(text[:2000])  # Process first 2000 chars
+            # Only look at entities within the header of the shared doc
+            head = doc.char_span(0, min(len(text), HEADER_CHARS), alignment_mode='contract')
+            head_ents = head.ents if head is not None else ()
             person_entities = []
             
             # Only use NER if the model has it
-            if doc.ents:
-                for ent in doc.ents:
+            if head_ents:
+                for ent in head_ents:
                     if ent.label_ == "PERSON":
                         name_text = ent.text.strip()
                         words = name_text.split()
@@ -288,11 +351,8 @@ class FixedResumeParser:
     
     def _extract_name_from_linkedin_url(self, text):
         """Extract name from LinkedIn URL"""
-        import re
-        
         # Find LinkedIn URLs
-        linkedin_pattern = r'https?://(?:www\.)?(?:in\.)?linkedin\.com/in/([a-zA-Z0-9-]+)'
-        matches = re.findall(linkedin_pattern, text)
+        matches = _LINKEDIN_RE.findall(text)
         
         for match in matches:
             # Convert LinkedIn username to name format
@@ -302,8 +362,6 @@ class FixedResumeParser:
             if ' ' not in username and username.isalpha() and len(username) > 4:
                 # Try to split concatenated names using common name patterns
                 # Look for capital letters that might indicate name boundaries
-                import re
-                
                 # Try splitting on capital letters in the middle
                 parts = re.findall(r'[A-Z][a-z]*|[a-z]+', username)
                 if len(parts) >= 2:
@@ -399,11 +457,8 @@ class FixedResumeParser:
     
     def _extract_name_from_email(self, text):
         """Extract name from email address as last resort"""
-        import re
-        
         # Find email addresses
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        emails = re.findall(email_pattern, text)
+        emails = EMAIL_RE.findall(text)
         
         for email in emails:
             # Get the part before @
@@ -469,91 +524,63 @@ class FixedResumeParser:
         
         return None
     
-    def _extract_email_with_spacy(self, text):
+    def _extract_email_with_spacy(self, text, doc, matches):
         """Extract email using spaCy patterns and regex"""
-        doc = self.nlp(text)
-        matches = self.matcher(doc)
-        
-        for match_id, start, end in matches:
-            if self.nlp.vocab.strings[match_id] == "EMAIL":
-                return doc[start:end].text
+        for span in matches.get("EMAIL", []):
+            return span.text
         
         # Fallback to regex
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        emails = re.findall(email_pattern, text)
-        return emails[0] if emails else None
+        match = EMAIL_RE.search(text)
+        return match.group(0) if match else None
     
-    def _extract_phone_with_spacy(self, text):
+    def _extract_phone_with_spacy(self, text, doc, matches):
         """Extract phone using spaCy patterns and regex"""
-        doc = self.nlp(text)
-        matches = self.matcher(doc)
-        
-        for match_id, start, end in matches:
-            if self.nlp.vocab.strings[match_id] == "PHONE":
-                return doc[start:end].text
+        for span in matches.get("PHONE", []):
+            return span.text
         
         # Fallback to regex
-        phone_patterns = [
-            r'\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}',
-            r'\+\d{1,3}[-.\s]?\d{3}[-.\s]?\d{3}[-.\s]?\d{4}'
-        ]
-        
-        for pattern in phone_patterns:
-            phones = re.findall(pattern, text)
-            if phones:
-                return phones[0]
-        
-        return None
+        match = _PHONE_RE.search(text)
+        return match.group(0) if match else None
     
-    def _extract_education_with_spacy(self, text):
+    def _extract_education_with_spacy(self, text, doc, matches):
         """Extract education using spaCy NER and patterns"""
-        doc = self.nlp(text)
         education = []
         
         # Look for educational institutions
         for ent in doc.ents:
-            if ent.label_ in ["ORG"] and any(keyword in ent.text.lower() 
-                for keyword in ["university", "college", "institute", "school"]):
+            if ent.label_ in ["ORG"] and _EDU_ORG_RE.search(ent.text):
                 education.append(ent.text)
         
         # Look for degrees using matcher
-        matches = self.matcher(doc)
-        for match_id, start, end in matches:
-            if self.nlp.vocab.strings[match_id] == "DEGREE":
-                education.append(doc[start:end].text)
+        for span in matches.get("DEGREE", []):
+            education.append(span.text)
         
         return list(set(education)) if education else None
     
-    def _extract_skills_with_spacy(self, text):
+    def _extract_skills_with_spacy(self, text, doc, matches):
         """Extract skills using spaCy and skills database"""
-        doc = self.nlp(text)
         found_skills = []
-        text_lower = text.lower()
-        
-        # Use skills database
-        for skill in self.skills_db:
-            if skill in text_lower:
-                found_skills.append(skill.title())
         
-        # Use spaCy patterns
-        matches = self.matcher(doc)
-        for match_id, start, end in matches:
-            if self.nlp.vocab.strings[match_id] == "SKILL":
-                found_skills.append(doc[start:end].text)
+        # Skills database hits from the PhraseMatcher
+        for span in matches.get("SKILL", []):
+            found_skills.append(span.text.title())
         
         # Extract technology mentions using NER
         for ent in doc.ents:
             if ent.label_ in ["PRODUCT", "ORG"] and len(ent.text.split()) <= 2:
                 # Could be a technology/framework
-                if any(tech_word in ent.text.lower() for tech_word in 
-                      ['js', 'sql', 'api', 'framework', 'library']):
+                if _TECH_ENT_RE.search(ent.text):
                     found_skills.append(ent.text)
         
-        return list(set(found_skills))[:10] if found_skills else None  # Limit to 10 skills
+        # Keep the first spelling of each skill, ignoring case
+        unique_skills = {}
+        for skill in found_skills:
+            unique_skills.setdefault(skill.lower(), skill)
+        
+        return list(unique_skills.values())[:10] if found_skills else None  # Limit to 10 skills
     
-    def _extract_experience_with_spacy(self, text):
+    def _extract_experience_with_spacy(self, text, doc, matches, token_doc):
         """Extract work experience using spaCy NER"""
-        doc = self.nlp(text)
         companies = []
         positions = []
         
@@ -561,21 +588,14 @@ class FixedResumeParser:
         for ent in doc.ents:
             if ent.label_ == "ORG":
                 # Filter out universities and common non-company entities
-                if not any(keyword in ent.text.lower() for keyword in 
-                          ["university", "college", "school", "institute"]):
+                if not _EDU_ORG_RE.search(ent.text):
                     companies.append(ent.text)
         
-        # Look for job titles in text
-        job_title_keywords = [
-            'engineer', 'developer', 'manager', 'analyst', 'consultant',
-            'specialist', 'coordinator', 'director', 'lead', 'senior',
-            'junior', 'intern', 'associate', 'architect', 'designer'
-        ]
-        
-        sentences = [sent.text for sent in doc.sents]
-        for sentence in sentences:
-            if any(title in sentence.lower() for title in job_title_keywords):
-                positions.append(sentence.strip())
+        # Look for job titles in text; sentence boundaries come from the
+        # sentencizer over the full tokenizer-only doc, not from the NER pass
+        for sent in _get_sentencizer()(token_doc).sents:
+            if _JOB_TITLE_RE.search(sent.text):
+                positions.append(sent.text.strip())
                 if len(positions) >= 3:  # Limit to 3 positions
                     break
         
@@ -588,47 +608,130 @@ class FixedResumeParser:
     
     def get_extracted_data(self):
         """Extract all data from resume using spaCy and NLTK"""
+        return self.extract(self.resume_path)
+    
+    def extract(self, resume_path):
+        """Extract all data from the given resume; the parser can be reused across files"""
         try:
             # Extract text from file
-            text = self._extract_text_from_file(self.resume_path)
-            
+            text = self._extract_text_from_file(resume_path)
+        except Exception as e:
+            print(f"Error extracting data: {e}")
+            return None
+        
+        return self.extract_from_text(text)
+    
+    def extract_from_text(self, text):
+        """Extract all data from text already pulled out of a resume"""
+        try:
             if not text or not text.strip():
                 return None
             
             print("Text extracted successfully")
             
-            # Use spaCy for advanced extraction
-            extracted_data = {
-                'name': self._extract_name_with_spacy(text),
-                'email': self._extract_email_with_spacy(text),
-                'mobile_number': self._extract_phone_with_spacy(text),
-                'skills': self._extract_skills_with_spacy(text),
-                'education': self._extract_education_with_spacy(text),
-                'experience': self._extract_experience_with_spacy(text),
-                'no_of_pages': len(text) // 3000 + 1,  # Rough estimate
-            }
-            
-            # Add convenience fields
-            if extracted_data['experience']:
-                extracted_data['company_names'] = extracted_data['experience'].get('companies')
-                extracted_data['designation'] = extracted_data['experience'].get('positions')
-            
-            # Calculate total experience (basic heuristic)
-            experience_keywords = ['years', 'year', 'experience']
-            exp_matches = []
-            for keyword in experience_keywords:
-                pattern = rf'(\d+)[\s\+]*{keyword}'
-                matches = re.findall(pattern, text.lower())
-                exp_matches.extend(matches)
-            
-            if exp_matches:
-                extracted_data['total_experience'] = f"{max(exp_matches)}+ years"
-            
-            return extracted_data
+            return self._extract_data_from_doc(text, self.nlp(self._select_ner_text(text)))
             
         except Exception as e:
             print(f"Error extracting data: {e}")
             return None
+    
+    def _select_ner_text(self, text):
+        """Cut the text down to the header plus the sections NER results are read from"""
+        headers = list(_SECTION_HEADER_RE.finditer(text))
+        
+        # No recognisable sections: let NER see everything
+        if not any(header.lastgroup for header in headers):
+            return text
+        
+        parts = [text[:HEADER_CHARS]]
+        
+        for header, next_header in zip(headers, headers[1:] + [None]):
+            if header.lastgroup is None:
+                continue
+            end = next_header.start() if next_header else len(text)
+            section = text[max(header.start(), HEADER_CHARS):end]
+            if section:
+                parts.append(section)
+        
+        return '\n\n'.join(parts)
+    
+    def _extract_data_from_doc(self, text, doc):
+        """Run every extractor against an already processed spaCy doc"""
+        # doc only covers the _select_ner_text() slice; the matchers are
+        # lexical, so run them once over a tokenizer-only doc of the full text
+        # and share the hits with every extractor
+        token_doc = self.nlp.make_doc(text)
+        matches = defaultdict(list)
+        for matcher in (self.matcher, self.skill_matcher):
+            for match_id, start, end in matcher(token_doc):
+                matches[self.nlp.vocab.strings[match_id]].append(token_doc[start:end])
+        
+        # Use spaCy for advanced extraction
+        extracted_data = {
+            'name': self._extract_name_with_spacy(text, doc, matches),
+            'email': self._extract_email_with_spacy(text, doc, matches),
+            'mobile_number': self._extract_phone_with_spacy(text, doc, matches),
+            'skills': self._extract_skills_with_spacy(text, doc, matches),
+            'education': self._extract_education_with_spacy(text, doc, matches),
+            'experience': self._extract_experience_with_spacy(text, doc, matches, token_doc),
+            'no_of_pages': len(text) // 3000 + 1,  # Rough estimate
+        }
+        
+        # Add convenience fields
+        if extracted_data['experience']:
+            extracted_data['company_names'] = extracted_data['experience'].get('companies')
+            extracted_data['designation'] = extracted_data['experience'].get('positions')
+        
+        # Calculate total experience (basic heuristic)
+        exp_matches = _EXP_YEARS_RE.findall(text)
+        
+        if exp_matches:
+            extracted_data['total_experience'] = f"{max(exp_matches)}+ years"
+        
+        return extracted_data
+    
+    def extract_batch(self, resume_paths, batch_size=32, n_process=1):
+        """Parse many resumes, streaming their texts through nlp.pipe in batches"""
+        paths = list(dict.fromkeys(resume_paths))
+        texts = []
+        
+        for path in paths:
+            try:
+                texts.append(self._extract_text_from_file(path))
+            except Exception as e:
+                print(f"Error extracting data: {e}")
+                texts.append(None)
+        
+        return dict(zip(paths, self.extract_batch_from_texts(texts, batch_size, n_process)))
+    
+    def extract_batch_from_texts(self, texts, batch_size=32, n_process=1):
+        """Parse many already extracted resume texts through nlp.pipe, returning results in order"""
+        results = [None] * len(texts)
+        usable = [i for i, text in enumerate(texts) if text and text.strip()]
+        
+        ner_texts = (self._select_ner_text(texts[i]) for i in usable)
+        docs = self.nlp.pipe(ner_texts, batch_size=batch_size, n_process=n_process)
+        for i, doc in zip(usable, docs):
+            try:
+                results[i] = self._extract_data_from_doc(texts[i], doc)
+            except Exception as e:
+                print(f"Error extracting data: {e}")
+        
+        return results
+    
+    @classmethod
+    def parse_batch(cls, resume_paths, skills_file=None, batch_size=32, n_process=1):
+        """Parse many resumes with a fresh parser, see extract_batch"""
+        return cls(skills_file=skills_file).extract_batch(resume_paths, batch_size, n_process)
+
+def _parse_one(resume_path):
+    """Worker task for parse_many; the spaCy model is loaded once per process"""
+    return FixedResumeParser(resume_path).get_extracted_data()
+
+def parse_many(resume_paths, workers=None):
+    """Parse many resumes in parallel across CPU cores, results in input order"""
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as executor:
+        return list(executor.map(_parse_one, resume_paths, chunksize=4))
 
 def main():
     """Main function to test the fixed parser"""
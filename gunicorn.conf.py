@@ -0,0 +1,17 @@
+# Gunicorn settings, picked up automatically from the working directory
+import os
+import multiprocessing
+
+# Each worker loads its own spaCy model, so cap the default worker count to
+# keep memory in check; override with WEB_CONCURRENCY on larger hosts.
+# Each worker also starts its own PDF extraction pool (see PDF_WORKERS)
+workers = int(os.environ.get('WEB_CONCURRENCY', min(multiprocessing.cpu_count(), 4)))
+# Let the app size its per-worker PDF pool to its share of the CPUs
+os.environ['WEB_CONCURRENCY'] = str(workers)
+
+# Threads within a worker share the loaded parsers
+worker_class = 'gthread'
+threads = int(os.environ.get('WEB_THREADS', '4'))
+
+# spaCy parsing of a large resume can take several seconds
+timeout = 120
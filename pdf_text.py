@@ -0,0 +1,18 @@
+import re
+from io import BytesIO
+
+from pdfminer.high_level import extract_text
+from pdfminer.layout import LAParams
+
+# Plain text layout analysis only; we never read character geometry
+PDF_LAPARAMS = LAParams(detect_vertical=False, all_texts=False)
+
+# pdfminer passes through the tabs and space runs in the content stream,
+# where pdfplumber rebuilt single spaces from character positions
+_INLINE_SPACE_RE = re.compile(r'[^\S\n]+')
+
+def extract_pdf_text(pdf_file, laparams=PDF_LAPARAMS):
+    """Extract plain text from a PDF path, raw bytes or binary file object"""
+    if isinstance(pdf_file, bytes):
+        pdf_file = BytesIO(pdf_file)
+    return _INLINE_SPACE_RE.sub(' ', extract_text(pdf_file, laparams=laparams))
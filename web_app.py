@@ -1,10 +1,26 @@
 import os
+import io
+import re
 import json
-from flask import Flask, request, render_template, redirect, url_for, flash, jsonify
+import functools
+import uuid
+import atexit
+import shutil
+import tempfile
+import threading
+import multiprocessing
+from collections import OrderedDict
+from flask import Flask, Response, request, abort, render_template, stream_template, redirect, url_for, flash, get_flashed_messages, jsonify
+from flask.helpers import get_debug_flag
+from flask_compress import Compress
+from werkzeug.exceptions import HTTPException
 from werkzeug.utils import secure_filename
-import traceback
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import xxhash
 
 # Import our parsers
+from pdf_text import extract_pdf_text
 from regex_parser import RegexResumeParser
 from fixed_pyresparser import FixedResumeParser
 
@@ -12,54 +28,328 @@ app = Flask(__name__)
 app.secret_key = 'your-secret-key-change-in-production'
 
 # Configuration
-UPLOAD_FOLDER = 'uploads'
+# Saved uploads live only until they are parsed, so keep them on tmpfs when
+# available. /dev/shm is shared by every local user, so each process gets its
+# own private (0700) directory there rather than a fixed, guessable path
+if os.environ.get('UPLOAD_FOLDER'):
+    UPLOAD_FOLDER = os.environ['UPLOAD_FOLDER']
+elif os.access('/dev/shm', os.W_OK):
+    UPLOAD_FOLDER = tempfile.mkdtemp(prefix='resume-uploads-', dir='/dev/shm')
+    atexit.register(shutil.rmtree, UPLOAD_FOLDER, ignore_errors=True)
+else:
+    UPLOAD_FOLDER = 'uploads'
 ALLOWED_EXTENSIONS = {'pdf', 'docx', 'doc'}
 MAX_FILE_SIZE = 16 * 1024 * 1024  # 16MB max file size
+_EXT_RE = re.compile(r'\.(?:%s)\Z' % '|'.join(sorted(ALLOWED_EXTENSIONS)), re.IGNORECASE)
+SPACY_BATCH_SIZE = int(os.environ.get('SPACY_BATCH_SIZE', '32'))  # Docs per nlp.pipe batch
+# Every gunicorn worker has its own PDF pool, so each gets its share of the CPUs
+PDF_WORKERS = int(os.environ.get('PDF_WORKERS',
+                                 max(1, (os.cpu_count() or 1) // int(os.environ.get('WEB_CONCURRENCY', '1')))))
+PDF_TIMEOUT = 60  # Seconds to wait for a PDF's text before giving up
+DEBUG = get_debug_flag()  # FLASK_DEBUG, parsed the way Flask itself does
+RESULT_CACHE_SIZE = int(os.environ.get('RESULT_CACHE_SIZE', '256'))  # Uploads whose results are kept
+PRELOAD = os.environ.get('PRELOAD', '1') == '1'
 
 app.config['UPLOAD_FOLDER'] = UPLOAD_FOLDER
 app.config['MAX_CONTENT_LENGTH'] = MAX_FILE_SIZE
+# Templates only change on deploy, so don't stat them on every render
+app.config['TEMPLATES_AUTO_RELOAD'] = DEBUG
+app.config['SEND_FILE_MAX_AGE_DEFAULT'] = 0 if DEBUG else 31536000  # One year
+# Result pages and JSON compress well; tiny responses aren't worth the CPU
+app.config['COMPRESS_ALGORITHM'] = ['br', 'gzip']
+# Streamed responses (the results page) can't use gzip in Flask-Compress
+app.config['COMPRESS_ALGORITHM_STREAMING'] = ['br', 'deflate']
+app.config['COMPRESS_MIN_SIZE'] = 1024
+Compress(app)
 
 # Ensure upload directory exists
 os.makedirs(UPLOAD_FOLDER, exist_ok=True)
 
+# Parsers are built once per process and reused for every request, so the
+# spaCy model and matchers are not reloaded per upload
+REGEX_PARSER = RegexResumeParser()
+FIXED_PARSER = FixedResumeParser()
+
+WARMUP_TEXT = """Jane Doe
+jane.doe@example.com | +1 555 010 0000
+
+Skills
+Python, SQL, Machine Learning
+
+Education
+B.Sc. Computer Science, State University
+
+Experience
+Software Engineer at Example Corp, 3 years
+"""
+
+# Run one small resume through both parsers so the first upload doesn't pay
+# for spaCy's lazy setup (sentencizer, matcher compilation, first pipeline call)
+if PRELOAD:
+    REGEX_PARSER.extract_resume_data_from_text(WARMUP_TEXT)
+    FIXED_PARSER.extract_from_text(WARMUP_TEXT)
+
+# The two parsers share no state, so each upload runs them side by side.
+# Under gunicorn's gthread worker every request thread needs a pair of slots
+WEB_THREADS = int(os.environ.get('WEB_THREADS', '4'))
+EXECUTOR = ThreadPoolExecutor(max_workers=2 * WEB_THREADS)
+
+def create_pdf_pool():
+    """Start a process pool for PDF text extraction"""
+    # Forking from a multithreaded worker can deadlock the child, so start
+    # pool processes from a clean forkserver where the platform has one
+    if 'forkserver' in multiprocessing.get_all_start_methods():
+        return ProcessPoolExecutor(max_workers=PDF_WORKERS, mp_context=multiprocessing.get_context('forkserver'))
+    return ProcessPoolExecutor(max_workers=PDF_WORKERS)
+
+# pdfminer is pure Python and holds the GIL, so PDF text extraction runs in
+# worker processes. Only set up when imported by a WSGI server: running this
+# file directly keeps extraction in-process for the dev server
+PDF_POOL = create_pdf_pool() if __name__ != '__main__' else None
+PDF_POOL_LOCK = threading.Lock()
+
 def allowed_file(filename):
     """Check if the uploaded file has an allowed extension"""
-    return '.' in filename and \
-           filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
+    return bool(_EXT_RE.search(filename))
+
+def upload_path(filename):
+    """Pick a fresh path in the upload folder for an allowed file, keeping its extension"""
+    ext = filename.rsplit('.', 1)[1].lower()
+    return os.path.join(app.config['UPLOAD_FOLDER'], f"{uuid.uuid4().hex}.{ext}")
+
+_NOT_FOUND = "Not found"
+MAX_DISPLAY_ITEMS = 10  # Longer lists are cut down for display
+
+def _format_value(value):
+    """Format a single extracted field for display"""
+    if type(value) is str:
+        return value
+    if value is None:
+        return _NOT_FOUND
+    if isinstance(value, list):
+        if not value:
+            return _NOT_FOUND
+        if len(value) > MAX_DISPLAY_ITEMS:
+            return value[:MAX_DISPLAY_ITEMS] + [f"... and {len(value) - MAX_DISPLAY_ITEMS} more"]
+        return value
+    if isinstance(value, dict):
+        # Nested dictionaries (like experience) are shown as-is
+        return value
+    return str(value)
 
 def format_result_for_display(data, parser_name):
     """Format parser results for better display in HTML"""
     if not data:
         return {"error": f"{parser_name} failed to extract data"}
     
-    formatted = {
+    return {
         "parser_name": parser_name,
         "success": True,
-        "data": {}
+        "data": {key: _format_value(value) for key, value in data.items()}
     }
+
+def replace_pdf_pool(pool):
+    """Swap a broken or stuck PDF_POOL for a fresh one, unless another request already has"""
+    global PDF_POOL
+    with PDF_POOL_LOCK:
+        if PDF_POOL is pool:
+            PDF_POOL = create_pdf_pool()
+            pool.shutdown(wait=False, cancel_futures=True)
+
+def submit_pdf_text(source):
+    """Queue a PDF's text extraction in PDF_POOL, returning the pool and the future"""
+    pool = PDF_POOL
+    try:
+        return pool, pool.submit(extract_pdf_text, source)
+    except BrokenProcessPool as e:
+        replace_pdf_pool(pool)
+        failed = Future()
+        failed.set_exception(e)
+        return pool, failed
+
+def wait_pdf_text(job):
+    """Wait for a PDF queued by submit_pdf_text"""
+    pool, future = job
+    try:
+        return future.result(timeout=PDF_TIMEOUT)
+    except TimeoutError:
+        # A task still waiting in the queue can simply be dropped. One that is
+        # already running can't be stopped, and it would hold a pool process
+        # for every later upload, so hand later uploads a fresh pool instead
+        if not future.cancel():
+            replace_pdf_pool(pool)
+        raise Exception(f"Error reading PDF: text extraction took longer than {PDF_TIMEOUT}s")
+    except BrokenProcessPool as e:
+        # A dead child (e.g. OOM on a hostile PDF) breaks the pool for good;
+        # swap in a fresh one so later uploads don't fail too
+        replace_pdf_pool(pool)
+        raise Exception(f"Error reading PDF: {e}")
+    except Exception as e:
+        raise Exception(f"Error reading PDF: {e}")
+
+def uses_pdf_pool(file_ext):
+    """Check whether an upload's text is extracted in PDF_POOL"""
+    return PDF_POOL is not None and file_ext.lstrip('.').lower() == 'pdf'
+
+def extract_text(source, file_ext):
+    """Get the text of an upload given as bytes or a saved path, sending PDFs to the process pool"""
+    if uses_pdf_pool(file_ext):
+        return wait_pdf_text(submit_pdf_text(source))
     
-    for key, value in data.items():
-        if value is None:
-            formatted["data"][key] = "Not found"
-        elif isinstance(value, list):
-            if not value:
-                formatted["data"][key] = "Not found"
-            elif len(value) > 10:  # Limit display to first 10 items
-                formatted["data"][key] = value[:10] + [f"... and {len(value)-10} more"]
-            else:
-                formatted["data"][key] = value
-        elif isinstance(value, dict):
-            # Handle nested dictionaries (like experience)
-            formatted["data"][key] = value
-        else:
-            formatted["data"][key] = str(value)
+    if isinstance(source, bytes):
+        source = io.BytesIO(source)
+    return REGEX_PARSER.extract_text_from_file(source, '.' + file_ext.lstrip('.').lower())
+
+def extract_texts(uploads):
+    """Extract the text of several (source, file_ext) uploads as (text, error) pairs, queueing all PDFs up front"""
+    jobs = [submit_pdf_text(source) if uses_pdf_pool(file_ext) else None for source, file_ext in uploads]
+    
+    results = []
+    for (source, file_ext), job in zip(uploads, jobs):
+        try:
+            text = wait_pdf_text(job) if job else extract_text(source, file_ext)
+            results.append((text, None))
+        except Exception as e:
+            results.append((None, f"Error extracting resume data: {e}"))
+    return results
+
+# Parser futures of recent uploads keyed by content, so a re-uploaded resume
+# (or one still being parsed for another request) is not parsed again
+RESULT_CACHE = OrderedDict()
+RESULT_CACHE_LOCK = threading.Lock()
+
+def content_key(data, file_ext):
+    """Hash an upload's bytes and extension into a result cache key"""
+    return f"{xxhash.xxh3_128_hexdigest(data)}{file_ext.lower()}"
+
+def reserve_parsers(key):
+    """Claim a cache entry for an upload before parsing it, returning (futures, is_new)"""
+    with RESULT_CACHE_LOCK:
+        futures = RESULT_CACHE.get(key)
+        if futures is not None:
+            RESULT_CACHE.move_to_end(key)
+            return futures, False
+        
+        futures = (Future(), Future())
+        RESULT_CACHE[key] = futures
+        while len(RESULT_CACHE) > RESULT_CACHE_SIZE:
+            RESULT_CACHE.popitem(last=False)
+    
+    # Failed parses are dropped again so the next upload retries
+    def forget_on_error(future):
+        if future.exception() is not None:
+            with RESULT_CACHE_LOCK:
+                if RESULT_CACHE.get(key) is futures:
+                    del RESULT_CACHE[key]
+    
+    for future in futures:
+        future.add_done_callback(forget_on_error)
+    return futures, True
+
+def copy_outcome(source, target):
+    """Pass a finished future's result or exception on to another future"""
+    if source.exception() is not None:
+        target.set_exception(source.exception())
+    else:
+        target.set_result(source.result())
+
+def submit_parsers(source, file_ext):
+    """Start both parsers on an upload, reusing the results of identical recent uploads"""
+    if not isinstance(source, bytes) or RESULT_CACHE_SIZE <= 0:
+        return start_parsers(source, file_ext)
+    
+    # The entry is reserved before text extraction starts, so a duplicate
+    # upload arriving mid-extraction waits on this one instead of parsing again
+    futures, is_new = reserve_parsers(content_key(source, file_ext))
+    if is_new:
+        try:
+            started_futures = start_parsers(source, file_ext)
+        except Exception as e:
+            # Never leave a reserved entry unresolved for later duplicates
+            for reserved in futures:
+                reserved.set_exception(e)
+            raise
+        for started, reserved in zip(started_futures, futures):
+            started.add_done_callback(lambda done, reserved=reserved: copy_outcome(done, reserved))
+    return futures
+
+def start_parsers(source, file_ext):
+    """Extract the upload's text once, then start both parsers on it"""
+    try:
+        text = extract_text(source, file_ext)
+    except Exception as e:
+        # Report the failure from each parser, as if it had read the file itself
+        failed = Future()
+        failed.set_exception(Exception(f"Error extracting resume data: {e}"))
+        return failed, failed
+    
+    regex_future = EXECUTOR.submit(REGEX_PARSER.extract_resume_data_from_text, text)
+    spacy_future = EXECUTOR.submit(FIXED_PARSER.extract_from_text, text)
+    return regex_future, spacy_future
+
+def run_parser(future, parser_name):
+    """Wait for a parser and format its result for display, or an error entry if it raised"""
+    try:
+        return format_result_for_display(future.result(), parser_name)
+    except Exception as e:
+        return {
+            "parser_name": parser_name,
+            "success": False,
+            "error": str(e)
+        }
+
+def collect_api_results(regex_future, spacy_future):
+    """Gather both parser results in the JSON API shape"""
+    results = {}
+    
+    try:
+        results['regex_parser'] = regex_future.result()
+    except Exception as e:
+        results['regex_parser'] = {'error': str(e)}
     
-    return formatted
+    try:
+        results['spacy_parser'] = spacy_future.result()
+    except Exception as e:
+        results['spacy_parser'] = {'error': str(e)}
+    
+    return results
+
+def wants_json():
+    """Check whether the client asked for JSON instead of the HTML results page"""
+    if request.args.get('json') == '1':
+        return True
+    return request.accept_mimetypes.best_match(['text/html', 'application/json']) == 'application/json'
+
+def upload_error(message, status):
+    """Report a failed /upload as a JSON error or as a flashed message on the upload page"""
+    if wants_json():
+        return jsonify({'error': message}), status
+    flash(message)
+    return redirect(url_for('index'))
+
+UPLOAD_ROUTES = ('/upload', '/api/upload', '/upload_stream', '/api/batch')
+
+@app.before_request
+def reject_oversized_uploads():
+    """Refuse uploads whose declared size is over the limit before reading any of the body"""
+    if request.path in UPLOAD_ROUTES and (request.content_length or 0) > MAX_FILE_SIZE:
+        abort(413)
+
+@functools.lru_cache(maxsize=None)
+def _render_static_page(template):
+    """Render a page without per-request content once and reuse the HTML"""
+    return render_template(template)
+
+def render_page(template):
+    """Render a page, from cache unless there are flashed messages to show"""
+    if app.debug or get_flashed_messages():
+        return render_template(template)
+    return _render_static_page(template)
 
 @app.route('/')
 def index():
     """Main page with file upload form"""
-    return render_template('index.html')
+    return render_page('index.html')
 
 @app.route('/upload', methods=['POST'])
 def upload_file():
@@ -67,69 +357,45 @@ def upload_file():
     try:
         # Check if file was uploaded
         if 'file' not in request.files:
-            flash('No file selected')
-            return redirect(request.url)
+            return upload_error('No file selected', 400)
         
         file = request.files['file']
         
         if file.filename == '':
-            flash('No file selected')
-            return redirect(request.url)
+            return upload_error('No file selected', 400)
         
         if not allowed_file(file.filename):
-            flash('Invalid file type. Please upload PDF, DOCX, or DOC files only.')
-            return redirect(request.url)
+            return upload_error('Invalid file type. Please upload PDF, DOCX, or DOC files only.', 400)
         
         if file and allowed_file(file.filename):
             # Secure the filename
             filename = secure_filename(file.filename)
             
-            # Save uploaded file
-            file_path = os.path.join(app.config['UPLOAD_FOLDER'], filename)
-            file.save(file_path)
+            # Parse straight from memory; the upload never touches the disk
+            data = file.read()
             
             # Process with both parsers
             results = {
                 "filename": filename,
-                "file_size": os.path.getsize(file_path),
+                "file_size": len(data),
                 "parsers": {}
             }
             
-            # Parser 1: Regex-based parser
-            try:
-                regex_parser = RegexResumeParser()
-                regex_data = regex_parser.extract_resume_data(file_path)
-                results["parsers"]["regex"] = format_result_for_display(regex_data, "Regex Parser")
-            except Exception as e:
-                results["parsers"]["regex"] = {
-                    "parser_name": "Regex Parser",
-                    "success": False,
-                    "error": str(e)
-                }
+            regex_future, spacy_future = submit_parsers(data, os.path.splitext(file.filename)[1])
             
-            # Parser 2: spaCy/NLTK-based parser
-            try:
-                spacy_parser = FixedResumeParser(file_path)
-                spacy_data = spacy_parser.get_extracted_data()
-                results["parsers"]["spacy"] = format_result_for_display(spacy_data, "spaCy + NLTK Parser")
-            except Exception as e:
-                results["parsers"]["spacy"] = {
-                    "parser_name": "spaCy + NLTK Parser",
-                    "success": False,
-                    "error": str(e)
-                }
+            results["parsers"]["regex"] = run_parser(regex_future, "Regex Parser")
+            results["parsers"]["spacy"] = run_parser(spacy_future, "spaCy + NLTK Parser")
             
-            # Clean up uploaded file
-            try:
-                os.remove(file_path)
-            except:
-                pass  # Ignore cleanup errors
+            if wants_json():
+                return jsonify(results)
             
-            return render_template('results.html', results=results)
+            # Send the page as Jinja renders it rather than building the whole string first
+            return Response(stream_template('results.html', results=results), mimetype='text/html')
     
+    except HTTPException:
+        raise
     except Exception as e:
-        flash(f'Error processing file: {str(e)}')
-        return redirect(url_for('index'))
+        return upload_error(f'Error processing file: {str(e)}', 500)
 
 @app.route('/api/upload', methods=['POST'])
 def api_upload():
@@ -143,46 +409,104 @@ def api_upload():
         if not allowed_file(file.filename):
             return jsonify({'error': 'Invalid file type'}), 400
         
-        filename = secure_filename(file.filename)
-        file_path = os.path.join(app.config['UPLOAD_FOLDER'], filename)
-        file.save(file_path)
+        # Parse straight from memory; the upload never touches the disk
+        regex_future, spacy_future = submit_parsers(file.read(), os.path.splitext(file.filename)[1])
         
-        # Process with both parsers
-        results = {}
+        return jsonify(collect_api_results(regex_future, spacy_future))
+    
+    except HTTPException:
+        raise
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/upload_stream', methods=['POST'])
+def upload_stream():
+    """API endpoint taking the raw file as the request body (name in X-Filename)"""
+    try:
+        filename = request.headers.get('X-Filename', '')
         
-        try:
-            regex_parser = RegexResumeParser()
-            results['regex_parser'] = regex_parser.extract_resume_data(file_path)
-        except Exception as e:
-            results['regex_parser'] = {'error': str(e)}
+        if not allowed_file(filename):
+            return jsonify({'error': 'Invalid file type'}), 400
         
+        # Copy the body straight to disk, skipping Werkzeug's multipart parser
+        file_path = upload_path(filename)
         try:
-            spacy_parser = FixedResumeParser(file_path)
-            results['spacy_parser'] = spacy_parser.get_extracted_data()
-        except Exception as e:
-            results['spacy_parser'] = {'error': str(e)}
+            file_size = 0
+            with open(file_path, 'wb') as f:
+                for chunk in iter(lambda: request.stream.read(1024 * 1024), b''):
+                    file_size += f.write(chunk)
+            
+            if file_size == 0:
+                return jsonify({'error': 'No file provided'}), 400
+            
+            regex_future, spacy_future = submit_parsers(file_path, os.path.splitext(file_path)[1])
+            return jsonify(collect_api_results(regex_future, spacy_future))
+        finally:
+            # Clean up, including partial files from an aborted or oversized body
+            try:
+                os.remove(file_path)
+            except OSError:
+                pass
+    
+    except HTTPException:
+        # e.g. 413 from Werkzeug when a chunked body runs past MAX_CONTENT_LENGTH
+        raise
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/api/batch', methods=['POST'])
+def api_batch():
+    """API endpoint that parses several resumes in one request"""
+    try:
+        files = request.files.getlist('files')
         
-        # Clean up
-        try:
-            os.remove(file_path)
-        except:
-            pass
+        if not files:
+            return jsonify({'error': 'No files provided'}), 400
+        
+        if not all(allowed_file(file.filename) for file in files):
+            return jsonify({'error': 'Invalid file type'}), 400
+        
+        # Each file's text is extracted once and shared by both parsers. All
+        # PDFs are queued in the process pool before any result is awaited
+        uploads = [(file.read(), os.path.splitext(file.filename)[1]) for file in files]
+        texts, errors = zip(*extract_texts(uploads))
+        
+        # All documents go through spaCy as one nlp.pipe stream
+        spacy_results = FIXED_PARSER.extract_batch_from_texts(list(texts), batch_size=SPACY_BATCH_SIZE)
+        
+        results = []
+        for file, text, error, spacy_result in zip(files, texts, errors, spacy_results):
+            result = {'filename': file.filename}
+            if error:
+                result['regex_parser'] = {'error': error}
+            else:
+                try:
+                    result['regex_parser'] = REGEX_PARSER.extract_resume_data_from_text(text)
+                except Exception as e:
+                    result['regex_parser'] = {'error': str(e)}
+            result['spacy_parser'] = spacy_result
+            results.append(result)
         
         return jsonify(results)
     
+    except HTTPException:
+        raise
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 @app.route('/about')
 def about():
     """About page explaining the parsers"""
-    return render_template('about.html')
+    return render_page('about.html')
 
 @app.errorhandler(413)
 def too_large(e):
     """Handle file too large error"""
+    # Only the browser form gets a redirect; API clients get a JSON error
+    if request.path != '/upload' or wants_json():
+        return jsonify({'error': 'File too large'}), 413
     flash("File is too large. Maximum size is 16MB.")
     return redirect(url_for('index'))
 
 if __name__ == '__main__':
-    app.run(debug=True, host='0.0.0.0', port=8080)
\ No newline at end of file
+    app.run(debug=DEBUG, host='0.0.0.0', port=8080)
\ No newline at end of file
@@ -0,0 +1,5 @@
+# WSGI entry point for production servers, e.g. `gunicorn wsgi:app`
+from web_app import app
+
+if __name__ == "__main__":
+    app.run()